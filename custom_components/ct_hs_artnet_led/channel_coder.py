@@ -1,6 +1,11 @@
 from . import DmxLightState
 
 
+# Shared lookup tables, keyed by the ChannelCoder parameters that determine
+# their contents. See ChannelCoder._build_lut.
+_LUT_CACHE = {}
+
+
 class ChannelCoders:
     def __init__(self, type_config) -> None:
         self._constant_channel_values = []
@@ -80,19 +85,51 @@ class ChannelCoders:
         assert self._hue_coder is not None
         assert self._saturation_coder is not None
 
+        # Flat call list for encode, ordered to match the state fields as
+        # unpacked in encode().
+        self._pipeline = (
+            self._brightness_coder.encode,
+            self._color_temp_coder.encode,
+            self._hue_coder.encode,
+            self._saturation_coder.encode,
+        )
+        # Frame template with the constant channels pre-baked; copied into a
+        # buffer in one memcpy the first time it is seen. The dynamic
+        # positions are zero, which is fine because a fresh buffer always
+        # gets all four coders run on it below.
+        template = bytearray(self._num_channels)
+        for channel_i, value in self._constant_channel_values:
+            template[channel_i] = value
+        self._template = bytes(template)
+
+        # Last buffer encoded into and the state values it holds, so that
+        # encode can skip channels whose field did not change between fade
+        # ticks. Holding a reference to the buffer guarantees its id is not
+        # reused by a new one.
+        self._last_buffer = None
+        self._last_state_values = [0.0] * len(self._pipeline)
+
     def num_channels(self):
         return self._num_channels
 
-    def encode(self, values: list[int], state: DmxLightState):
-        self._brightness_coder.encode(values, state.brightness)
-        self._color_temp_coder.encode(values, state.color_temp_kelvin)
-        self._hue_coder.encode(values, state.hue)
-        self._saturation_coder.encode(values, state.saturation)
-        for (
-            channel_i,
-            value,
-        ) in self._constant_channel_values:
-            values[channel_i] = value
+    def encode(self, values: bytearray, state: DmxLightState):
+        fresh_buffer = values is not self._last_buffer
+        if fresh_buffer:
+            self._last_buffer = values
+            values[:] = self._template
+
+        # Read each state attribute exactly once per frame.
+        state_values = (
+            state.brightness,
+            state.color_temp_kelvin,
+            state.hue,
+            state.saturation,
+        )
+        last = self._last_state_values
+        for i, (encode_fn, value) in enumerate(zip(self._pipeline, state_values)):
+            if fresh_buffer or abs(value - last[i]) >= 1e-6:
+                encode_fn(values, value)
+                last[i] = value
 
 
 class ChannelCoder:
@@ -128,11 +165,91 @@ class ChannelCoder:
             self._channel_range += 1
 
         self._is_hue = is_hue
-        self._correction_polynomial = correction_polynomial
+        # Stored highest-degree first for Horner's method in
+        # _compute_channel_value; None when there is no correction.
+        if correction_polynomial is not None:
+            self._correction_reversed = tuple(reversed(correction_polynomial))
+        else:
+            self._correction_reversed = None
+
+        self._build_lut()
+        # Bind a specialized closure so each encode call carries only the
+        # work its variant needs; correction and hue wraparound are already
+        # folded into the LUT, leaving byte width as the only variant.
+        self.encode = self._make_encode()
+
+    def _build_lut(self):
+        # Precompute every possible channel value once, so that encode() is
+        # just an index computation plus table lookups. The correction
+        # polynomial is evaluated here, once per entry, so no polynomial
+        # math remains at encode time. The number of entries is chosen so
+        # that the quantization error is well below one channel step, and so
+        # that integer input values land exactly on the grid.
+        #
+        # Every light of a type produces identical tables, and a 16-bit
+        # table takes ~100ms to fill in pure Python — enough to visibly
+        # block startup when each of a few dozen entities rebuilds it. The
+        # tables are immutable after construction, so build each distinct
+        # one once and share it through a module-level cache.
+        cache_key = (
+            self._min_value,
+            self._max_value,
+            self._num_bytes,
+            self._big_endian,
+            self._channel_min_value,
+            self._is_hue,
+            self._correction_reversed,
+        )
+        cached = _LUT_CACHE.get(cache_key)
+        if cached is not None:
+            self._lut_max_index, self._lut_scale, self._lut_b0, self._lut_b1 = cached
+            return
+
+        target_entries = 4096 if self._num_bytes == 1 else 65536
+        entries_per_unit = max(1, int(round(target_entries / self._value_range)))
+        self._lut_max_index = int(round(self._value_range * entries_per_unit))
+        self._lut_scale = self._lut_max_index / self._value_range
+
+        if self._num_bytes == 2:
+            lut_b0 = bytearray(self._lut_max_index + 1)
+            lut_b1 = bytearray(self._lut_max_index + 1)
+            # Resolve endianness once: map the hi/lo bytes to the first and
+            # second stored byte outside the loop.
+            if self._big_endian:
+                lut_hi, lut_lo = lut_b0, lut_b1
+            else:
+                lut_hi, lut_lo = lut_b1, lut_b0
+            for i in range(self._lut_max_index + 1):
+                channel_value = self._compute_channel_value(
+                    self._min_value + i / self._lut_scale
+                )
+                lut_hi[i] = channel_value >> 8
+                lut_lo[i] = channel_value & 0xFF
+            # Freeze to bytes so sharing between instances is safe.
+            self._lut_b0 = bytes(lut_b0)
+            self._lut_b1 = bytes(lut_b1)
+        else:
+            lut = bytearray(self._lut_max_index + 1)
+            for i in range(self._lut_max_index + 1):
+                lut[i] = self._compute_channel_value(
+                    self._min_value + i / self._lut_scale
+                )
+            self._lut_b0 = bytes(lut)
+            self._lut_b1 = None
+
+        _LUT_CACHE[cache_key] = (
+            self._lut_max_index,
+            self._lut_scale,
+            self._lut_b0,
+            self._lut_b1,
+        )
 
-    def encode(self, values: list[int], value: float):
-        if self._correction_polynomial is not None:
-            value = self._apply_correction(value, self._correction_polynomial)
+    def _compute_channel_value(self, value: float) -> int:
+        if self._correction_reversed is not None:
+            corrected_value = 0.0
+            for coefficient in self._correction_reversed:
+                corrected_value = corrected_value * value + coefficient
+            value = corrected_value
         value = min(value, self._max_value)
         value = max(value, self._min_value)
 
@@ -148,24 +265,43 @@ class ChannelCoder:
                 channel_value = self._channel_min_value
         else:
             assert channel_value <= self._channel_max_value
+        return channel_value
+
+    def _make_encode(self):
+        channel_i = self._channel_i
+        scale = self._lut_scale
+        # Zero-point folded into the bias (together with the rounding half),
+        # so indexing is a single multiply-add, like a quantization
+        # scale/zero-point pair.
+        bias = -self._min_value * self._lut_scale + 0.5
+        # The index bounds checks below are the only clamping left at encode
+        # time. They have to stay even for HA-validated inputs: the LCH-based
+        # hue fades can overshoot the nominal range by a hair, and an
+        # unclamped index would raise IndexError mid-frame.
+        max_index = self._lut_max_index
 
         if self._num_bytes == 2:
-            hi = int(channel_value / 256)
-            lo = channel_value % 256
-            if self._big_endian:
-                values[self._channel_i] = hi
-                values[self._channel_i + 1] = lo
-            else:
-                values[self._channel_i] = lo
-                values[self._channel_i + 1] = hi
+            lut_b0 = self._lut_b0
+            lut_b1 = self._lut_b1
+
+            def encode(values: bytearray, value: float):
+                index = int(value * scale + bias)
+                if index < 0:
+                    index = 0
+                elif index > max_index:
+                    index = max_index
+                values[channel_i] = lut_b0[index]
+                values[channel_i + 1] = lut_b1[index]
+
         else:
-            values[self._channel_i] = channel_value
-
-    def _apply_correction(self, value: float, coefficients: list[float]) -> float:
-        corrected_value = 0
-        for exponent, coefficient in enumerate(coefficients):
-            term = coefficient
-            for i in range(exponent):
-                term *= value
-            corrected_value += term
-        return corrected_value
+            lut = self._lut_b0
+
+            def encode(values: bytearray, value: float):
+                index = int(value * scale + bias)
+                if index < 0:
+                    index = 0
+                elif index > max_index:
+                    index = max_index
+                values[channel_i] = lut[index]
+
+        return encode
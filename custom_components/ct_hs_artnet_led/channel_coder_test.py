@@ -125,3 +125,52 @@ def test_aputure():
         coders.encode(values, state)
 
         assert values == [178, 28, 171, 118, 0]
+
+
+def test_encode_skip_cache():
+    # Exercises the unchanged-field skip path in ChannelCoders.encode, which
+    # only triggers when the same buffer is encoded more than once. Every
+    # result is checked against a full encode by a fresh ChannelCoders.
+    with open("test_config.yaml", encoding="ascii") as f:
+        config = yaml.safe_load(f)
+        type_config = config["light"][0]["types"][0]
+        assert type_config["name"] == "astera"
+    coders = ChannelCoders(type_config)
+
+    def full_encode(state):
+        expected = bytearray(coders.num_channels())
+        ChannelCoders(type_config).encode(expected, state)
+        return expected
+
+    state = DmxLightState(
+        brightness=70,
+        color_temp_kelvin=5500,
+        hue=40,
+        saturation=79,
+    )
+    values = bytearray(coders.num_channels())
+    coders.encode(values, state)
+    assert values == bytearray([179, 50, 117, 0, 28, 114, 106])
+
+    # Re-encode the same buffer with only the hue changed; the other three
+    # fields take the skip path and must keep their previous bytes.
+    state.hue = 220
+    coders.encode(values, state)
+    assert values == full_encode(state)
+
+    # Encoding a different buffer in between resets the skip cache.
+    other_state = DmxLightState(
+        brightness=5,
+        color_temp_kelvin=2000,
+        hue=0,
+        saturation=0,
+    )
+    other_values = bytearray(coders.num_channels())
+    coders.encode(other_values, other_state)
+    assert other_values == full_encode(other_state)
+
+    # Coming back to the first buffer must re-encode every field, including
+    # the constant channels from the template.
+    state.brightness = 30
+    coders.encode(values, state)
+    assert values == full_encode(state)
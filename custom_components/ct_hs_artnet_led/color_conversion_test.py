@@ -0,0 +1,40 @@
+from .fade_controller import _hsv_to_lch, _lch_to_hsv
+
+import math
+
+
+def test_known_values():
+    # sRGB primaries, Lab D65 reference values.
+    lch_l, lch_c, lch_h = _hsv_to_lch(0, 1, 1)  # Red.
+    assert abs(lch_l - 53.24) < 0.01
+    assert abs(lch_c - 104.55) < 0.01
+    assert abs(lch_h - 39.999) < 0.01
+
+    lch_l, lch_c, lch_h = _hsv_to_lch(120, 1, 1)  # Green.
+    assert abs(lch_l - 87.735) < 0.01
+    assert abs(lch_c - 119.776) < 0.01
+    assert abs(lch_h - 136.016) < 0.01
+
+    lch_l, lch_c, lch_h = _hsv_to_lch(0, 0, 1)  # White.
+    assert abs(lch_l - 100) < 0.01
+    assert lch_c < 0.01
+
+
+def test_round_trip():
+    for hue in range(0, 360, 20):
+        for saturation in [0.1, 0.5, 0.9, 1.0]:
+            for value in [0.1, 0.5, 1.0]:
+                lch = _hsv_to_lch(hue, saturation, value)
+                h, s, v = _lch_to_hsv(*lch)
+                assert abs(h - hue) < 0.01, (hue, saturation, value)
+                assert abs(s - saturation) < 0.001, (hue, saturation, value)
+                assert abs(v - value) < 0.001, (hue, saturation, value)
+
+
+def test_achromatic_round_trip():
+    for value in [0.0, 0.25, 1.0]:
+        lch = _hsv_to_lch(0, 0, value)
+        # Hue is undefined for grays, so only check saturation and value.
+        _, s, v = _lch_to_hsv(*lch)
+        assert s < 1e-3
+        assert abs(v - value) < 0.001
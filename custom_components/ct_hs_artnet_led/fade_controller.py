@@ -1,10 +1,8 @@
 from collections.abc import Callable
-import colormath.color_objects
-import colormath.color_conversions
-import copy
-from enum import Enum
+from dataclasses import replace
 import logging
-from time import time
+import math
+from time import monotonic
 
 import pyartnet
 
@@ -15,7 +13,111 @@ from . import DmxLightState
 log = logging.getLogger(__name__)
 
 
-class FadeType(Enum):
+# Direct HSV <-> LCHab conversion, replacing colormath's generic conversion
+# graph (HSV -> sRGB -> XYZ -> Lab -> LCH through per-step color objects),
+# which dominated the per-frame cost of hue fades. Uses sRGB with the D65
+# white point throughout.
+_RGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+_XYZ_TO_RGB = (
+    (3.2404542, -1.5371385, -0.4985314),
+    (-0.9692660, 1.8760108, 0.0415560),
+    (0.0556434, -0.2040259, 1.0572252),
+)
+_WHITE = (0.95047, 1.0, 1.08883)
+_LAB_EPSILON = 216 / 24389
+_LAB_KAPPA = 24389 / 27
+
+
+def _hsv_to_lch(hue, saturation, value):
+    # HSV -> sRGB, standard sector formula.
+    hue = hue % 360
+    chroma = value * saturation
+    hue_prime = hue / 60
+    x = chroma * (1 - abs(hue_prime % 2 - 1))
+    if hue_prime < 1:
+        r, g, b = chroma, x, 0.0
+    elif hue_prime < 2:
+        r, g, b = x, chroma, 0.0
+    elif hue_prime < 3:
+        r, g, b = 0.0, chroma, x
+    elif hue_prime < 4:
+        r, g, b = 0.0, x, chroma
+    elif hue_prime < 5:
+        r, g, b = x, 0.0, chroma
+    else:
+        r, g, b = chroma, 0.0, x
+    m = value - chroma
+    r, g, b = r + m, g + m, b + m
+
+    # sRGB -> linear RGB -> XYZ.
+    linear = []
+    for u in (r, g, b):
+        linear.append(u / 12.92 if u <= 0.04045 else ((u + 0.055) / 1.055) ** 2.4)
+    xyz = []
+    for row in _RGB_TO_XYZ:
+        xyz.append(row[0] * linear[0] + row[1] * linear[1] + row[2] * linear[2])
+
+    # XYZ -> Lab -> LCH.
+    f = []
+    for component, white in zip(xyz, _WHITE):
+        t = component / white
+        f.append(
+            t ** (1 / 3) if t > _LAB_EPSILON else (_LAB_KAPPA * t + 16) / 116
+        )
+    lch_l = 116 * f[1] - 16
+    lab_a = 500 * (f[0] - f[1])
+    lab_b = 200 * (f[1] - f[2])
+    lch_c = math.hypot(lab_a, lab_b)
+    lch_h = math.degrees(math.atan2(lab_b, lab_a)) % 360
+    return lch_l, lch_c, lch_h
+
+
+def _lch_to_hsv(lch_l, lch_c, lch_h):
+    # LCH -> Lab -> XYZ.
+    h_rad = math.radians(lch_h)
+    lab_a = lch_c * math.cos(h_rad)
+    lab_b = lch_c * math.sin(h_rad)
+    f_y = (lch_l + 16) / 116
+    f_x = f_y + lab_a / 500
+    f_z = f_y - lab_b / 200
+    xyz = []
+    for f, white in zip((f_x, f_y, f_z), _WHITE):
+        t = f**3
+        if t <= _LAB_EPSILON:
+            t = (116 * f - 16) / _LAB_KAPPA
+        xyz.append(t * white)
+
+    # XYZ -> linear RGB, clamped to the sRGB gamut so that the HSV result
+    # stays well defined when the interpolated LCH point falls outside it.
+    rgb = []
+    for row in _XYZ_TO_RGB:
+        u = row[0] * xyz[0] + row[1] * xyz[1] + row[2] * xyz[2]
+        u = min(1.0, max(0.0, u))
+        rgb.append(12.92 * u if u <= 0.0031308 else 1.055 * u ** (1 / 2.4) - 0.055)
+    r, g, b = rgb
+
+    # sRGB -> HSV.
+    value = max(r, g, b)
+    spread = value - min(r, g, b)
+    if spread == 0:
+        return 0.0, 0.0, value
+    if value == r:
+        hue = 60 * ((g - b) / spread % 6)
+    elif value == g:
+        hue = 60 * ((b - r) / spread + 2)
+    else:
+        hue = 60 * ((r - g) / spread + 4)
+    saturation = spread / value
+    return hue, saturation, value
+
+
+class FadeType:
+    # Plain integer constants: comparisons hit CPython's int fast path
+    # instead of Enum.__eq__.
     OFF_TO_ON = 1
     ON_TO_OFF = 2
     UNSATURATED_TO_SATURATED = 3
@@ -25,6 +127,42 @@ class FadeType(Enum):
 
 
 class FadeController:
+    __slots__ = (
+        "_start_time_secs",
+        "_end_time_secs",
+        "_inv_duration",
+        "is_done",
+        "_last_state_change_time_secs",
+        "_change_delay_secs",
+        "_num_changes",
+        "_last_home_assistant_update_time_secs",
+        "_home_assistant_update_state_frequency_secs",
+        "_home_assistant_update_state_callback",
+        "_current_state",
+        "_start_state",
+        "_target_state",
+        "current_values",
+        "_coders",
+        "_start_brightness",
+        "_start_color_temp",
+        "_start_saturation",
+        "_d_brightness",
+        "_d_color_temp",
+        "_d_saturation",
+        "_fade_type",
+        "_fade_fn",
+        # Only set for hue fades.
+        "_start_lch_l",
+        "_start_lch_c",
+        "_start_lch_h",
+        "_current_lch_l",
+        "_current_lch_c",
+        "_current_lch_h",
+        "_d_lch_l",
+        "_d_lch_c",
+        "_d_lch_h",
+    )
+
     def __init__(
         self,
         mutable_current_state: DmxLightState,
@@ -35,9 +173,13 @@ class FadeController:
         update_state_frequency_secs: float,
         update_state_callback: Callable[[], None],
     ) -> None:
-        self._start_time_secs = time()
+        self._start_time_secs = monotonic()
         self._end_time_secs = self._start_time_secs + fade_duration_secs
-        self._is_done = False
+        # Multiply by the reciprocal instead of dividing every tick. Zero
+        # durations never reach FadeController (light.py takes the
+        # no-transition path), but guard anyway.
+        self._inv_duration = 1 / fade_duration_secs if fade_duration_secs > 0 else 0.0
+        self.is_done = False
 
         self._last_state_change_time_secs = self._start_time_secs
         self._change_delay_secs = 1 / fps
@@ -48,49 +190,84 @@ class FadeController:
         self._home_assistant_update_state_callback = update_state_callback
 
         self._current_state = mutable_current_state
-        self._start_state = copy.deepcopy(mutable_current_state)
+        self._start_state = replace(mutable_current_state)
         self._target_state = target_state
 
-        self._values = [0] * coders.num_channels()
-        coders.encode(self._values, mutable_current_state)
+        # Contiguous byte buffer: one byte per DMX channel, no boxed ints.
+        # Faders index into this directly.
+        self.current_values = bytearray(coders.num_channels())
+        coders.encode(self.current_values, mutable_current_state)
         self._coders = coders
 
+        # Per-fade start values and deltas, computed once. Each tick
+        # evaluates start + delta * global_fraction, so the value lands
+        # exactly on the target at fraction 1 with no drift accumulated
+        # across ticks, and the per-tick paths never walk the state
+        # dataclasses.
+        self._start_brightness = self._start_state.brightness
+        self._start_color_temp = self._start_state.color_temp_kelvin
+        self._start_saturation = self._start_state.saturation
+        self._d_brightness = target_state.brightness - self._start_brightness
+        self._d_color_temp = target_state.color_temp_kelvin - self._start_color_temp
+        self._d_saturation = target_state.saturation - self._start_saturation
+
         if self._start_state.brightness == 0 and self._target_state.brightness > 0:
             self._fade_type = FadeType.OFF_TO_ON
+            self._fade_fn = self._off_to_on_fade
         elif self._start_state.brightness > 0 and self._target_state.brightness == 0:
             self._fade_type = FadeType.ON_TO_OFF
+            self._fade_fn = self._on_to_off_fade
         elif self._start_state.saturation == 0 and self._target_state.saturation > 0:
             self._fade_type = FadeType.UNSATURATED_TO_SATURATED
+            self._fade_fn = self._unsaturated_to_saturated_fade
         elif self._start_state.saturation > 0 and self._target_state.saturation == 0:
             self._fade_type = FadeType.SATURATED_TO_UNSATURATED
+            self._fade_fn = self._saturated_to_unsaturated_fade
         elif self._start_state.hue != self._target_state.hue:
             self._fade_type = FadeType.HUE_FADE
+            self._fade_fn = self._hue_fade
             self._init_hue_fade()
         else:
+            assert self._start_state.hue == self._target_state.hue
             self._fade_type = FadeType.OTHER
+            self._fade_fn = self._other_fade
+
+    # The code is set up so that the channel-0 Fader calls this once per
+    # frame, very frequently; all Faders then read current_values/is_done
+    # directly until every channel reports done.
+    def tick(self):
+        # Once done, state and values never change; skip the clock read and
+        # both checks if pyartnet polls again before dropping the fade.
+        if self.is_done:
+            return
 
-    # The code is set up so that this function will get called once for each
-    # channel in incremental order, very frequently, until all channels return
-    # True for the second return value.
-    def calc_next_value(self, channel_i) -> tuple[float, bool]:
-        if channel_i == 0:
-            self._maybe_update_state()
-            self._maybe_send_update_to_home_assistant()
+        # One clock read per frame, shared by both checks below.
+        now_secs = monotonic()
+        self._maybe_update_state(now_secs)
+        self._maybe_send_update_to_home_assistant(now_secs)
 
-        return self._values[channel_i], self._is_done
+    def make_faders(self) -> list["Fader"]:
+        # pyartnet wants one FadeBase per channel, so a single array-backed
+        # fader is not an option; hand out the lightest possible handles
+        # instead.
+        return [Fader(i, self) for i in range(len(self.current_values))]
 
-    def _maybe_update_state(self):
-        current_time_secs = time()
+    def _maybe_update_state(self, current_time_secs: float):
         if (
             current_time_secs - self._last_state_change_time_secs
             < self._change_delay_secs
         ):
             return
 
-        change_time_secs = self._last_state_change_time_secs + self._change_delay_secs
-        while change_time_secs + self._change_delay_secs < current_time_secs:
-            # We may occassionally skip frames if the CPU isn't able to keep up.
-            change_time_secs += self._change_delay_secs
+        # We may occassionally skip frames if the CPU isn't able to keep up;
+        # jump straight to the most recent whole tick instead of looping.
+        num_ticks = int(
+            (current_time_secs - self._last_state_change_time_secs)
+            // self._change_delay_secs
+        )
+        change_time_secs = (
+            self._last_state_change_time_secs + num_ticks * self._change_delay_secs
+        )
 
         is_first_step = self._last_state_change_time_secs == self._start_time_secs
         is_last_step = change_time_secs >= self._end_time_secs
@@ -99,18 +276,17 @@ class FadeController:
             self._debug_print_state()
 
         self._compute_new_state(change_time_secs, is_first_step, is_last_step)
-        self._coders.encode(self._values, self._current_state)
+        self._coders.encode(self.current_values, self._current_state)
 
         if is_first_step:
             self._debug_print_state()
 
         self._last_state_change_time_secs = change_time_secs
         self._num_changes += 1
-        self._is_done = is_last_step
+        self.is_done = is_last_step
 
-    def _maybe_send_update_to_home_assistant(self):
-        current_time_secs = time()
-        if self._is_done or (
+    def _maybe_send_update_to_home_assistant(self, current_time_secs: float):
+        if self.is_done or (
             current_time_secs - self._last_home_assistant_update_time_secs
             >= self._home_assistant_update_state_frequency_secs
         ):
@@ -119,15 +295,20 @@ class FadeController:
             self._debug_print_state()
 
     def _debug_print_state(self):
+        # Skip all the f-string and round() work unless DEBUG is actually
+        # enabled.
+        if not log.isEnabledFor(logging.DEBUG):
+            return
+
         if self._fade_type == FadeType.HUE_FADE:
             log.debug(
                 f"bright={round(self._current_state.brightness, 1)}, "
                 f"ct={round(self._current_state.color_temp_kelvin)}, "
                 f"hue={round(self._current_state.hue)}, "
                 f"sat={round(self._current_state.saturation, 1)}, "
-                f"l={round(self._current_lch.lch_l, 1)}, "
-                f"c={round(self._current_lch.lch_c, 1)}, "
-                f"h={round(self._current_lch.lch_h, 1)}"
+                f"l={round(self._current_lch_l, 1)}, "
+                f"c={round(self._current_lch_c, 1)}, "
+                f"h={round(self._current_lch_h, 1)}"
             )
         else:
             log.debug(
@@ -137,7 +318,7 @@ class FadeController:
                 f"sat={round(self._current_state.saturation, 1)}"
             )
 
-        if self._is_done:
+        if self.is_done:
             intended_fps = round(1 / self._change_delay_secs)
             actual_fps = round(
                 self._num_changes / (self._end_time_secs - self._start_time_secs)
@@ -147,38 +328,32 @@ class FadeController:
     def _compute_new_state(
         self, change_time_secs: float, is_first_step: bool, is_last_step: bool
     ):
-        travel_fraction = (change_time_secs - self._last_state_change_time_secs) / (
-            self._end_time_secs - self._last_state_change_time_secs
-        )
-        travel_fraction = min(1, travel_fraction)
-
-        if self._fade_type == FadeType.OFF_TO_ON:
-            self._off_to_on_fade(travel_fraction, is_first_step, is_last_step)
-        elif self._fade_type == FadeType.ON_TO_OFF:
-            self._on_to_off_fade(travel_fraction, is_first_step, is_last_step)
-        elif self._fade_type == FadeType.UNSATURATED_TO_SATURATED:
-            self._unsaturated_to_saturated_fade(
-                travel_fraction, is_first_step, is_last_step
-            )
-        elif self._fade_type == FadeType.SATURATED_TO_UNSATURATED:
-            self._saturated_to_unsaturated_fade(
-                travel_fraction, is_first_step, is_last_step
-            )
-        elif self._fade_type == FadeType.HUE_FADE:
-            self._hue_fade(travel_fraction, is_first_step, is_last_step)
+        if is_last_step:
+            # Force the exact endpoint. The computed fraction can land a few
+            # 1e-12 short of 1 on the last tick, because _end_time_secs is
+            # rounded on a large monotonic() base while the fraction is
+            # computed from the duration itself. Code elsewhere compares
+            # fields against exact 0 (is_on, the fade classification, the
+            # default brightness/color-temp logic in async_turn_on), so
+            # fades must land exactly on the target.
+            global_fraction = 1.0
         else:
-            self._other_fade(travel_fraction, is_first_step, is_last_step)
+            global_fraction = (
+                change_time_secs - self._start_time_secs
+            ) * self._inv_duration
 
-    def _off_to_on_fade(self, travel_fraction, is_first_step, is_last_step):
+        self._fade_fn(global_fraction, is_first_step, is_last_step)
+
+    def _off_to_on_fade(self, global_fraction, is_first_step, is_last_step):
         if is_first_step:
             self._current_state.color_temp_kelvin = self._target_state.color_temp_kelvin
             self._current_state.hue = self._target_state.hue
             self._current_state.saturation = self._target_state.saturation
 
-        self._linear_fade_brightness(travel_fraction)
+        self._linear_fade_brightness(global_fraction)
 
-    def _on_to_off_fade(self, travel_fraction, is_first_step, is_last_step):
-        self._linear_fade_brightness(travel_fraction)
+    def _on_to_off_fade(self, global_fraction, is_first_step, is_last_step):
+        self._linear_fade_brightness(global_fraction)
 
         if is_last_step:
             self._current_state.color_temp_kelvin = self._target_state.color_temp_kelvin
@@ -186,118 +361,98 @@ class FadeController:
             self._current_state.saturation = self._target_state.saturation
 
     def _unsaturated_to_saturated_fade(
-        self, travel_fraction, is_first_step, is_last_step
+        self, global_fraction, is_first_step, is_last_step
     ):
         if is_first_step:
             self._current_state.hue = self._target_state.hue
 
-        self._linear_fade_brightness(travel_fraction)
-        self._linear_fade_color_temp(travel_fraction)
-        self._linear_fade_saturation(travel_fraction)
+        self._linear_fade_brightness(global_fraction)
+        self._linear_fade_color_temp(global_fraction)
+        self._linear_fade_saturation(global_fraction)
 
     def _saturated_to_unsaturated_fade(
-        self, travel_fraction, is_first_step, is_last_step
+        self, global_fraction, is_first_step, is_last_step
     ):
-        self._linear_fade_brightness(travel_fraction)
-        self._linear_fade_color_temp(travel_fraction)
-        self._linear_fade_saturation(travel_fraction)
+        self._linear_fade_brightness(global_fraction)
+        self._linear_fade_color_temp(global_fraction)
+        self._linear_fade_saturation(global_fraction)
 
         if is_last_step:
             self._current_state.hue = self._target_state.hue
 
     def _init_hue_fade(self):
-        current_hsv = colormath.color_objects.HSVColor(
+        self._start_lch_l, self._start_lch_c, self._start_lch_h = _hsv_to_lch(
             self._current_state.hue,
             self._current_state.saturation / 100,
             self._current_state.brightness / 100,
         )
-        self._current_lch = colormath.color_conversions.convert_color(
-            current_hsv, colormath.color_objects.LCHabColor
-        )
-        target_hsv = colormath.color_objects.HSVColor(
+        self._current_lch_l = self._start_lch_l
+        self._current_lch_c = self._start_lch_c
+        self._current_lch_h = self._start_lch_h
+
+        target_lch_l, target_lch_c, target_lch_h = _hsv_to_lch(
             self._target_state.hue,
             self._target_state.saturation / 100,
             self._target_state.brightness / 100,
         )
-        self._target_lch = colormath.color_conversions.convert_color(
-            target_hsv, colormath.color_objects.LCHabColor
-        )
-
-    def _hue_fade(self, travel_fraction, is_first_step, is_last_step):
+        self._d_lch_l = target_lch_l - self._start_lch_l
+        self._d_lch_c = target_lch_c - self._start_lch_c
+        # Take the shorter way around the hue circle; the wrap is applied
+        # once here instead of on every tick.
+        d_lch_h = target_lch_h - self._start_lch_h
+        if d_lch_h > 180:
+            d_lch_h -= 360
+        elif d_lch_h < -180:
+            d_lch_h += 360
+        self._d_lch_h = d_lch_h
+
+    def _hue_fade(self, global_fraction, is_first_step, is_last_step):
         # Color temperature fades independently.
-        self._linear_fade_color_temp(travel_fraction)
-
-        self._current_lch.lch_l = self._compute_linear_update(
-            self._current_lch.lch_l, self._target_lch.lch_l, travel_fraction
-        )
-        self._current_lch.lch_c = self._compute_linear_update(
-            self._current_lch.lch_c, self._target_lch.lch_c, travel_fraction
+        self._linear_fade_color_temp(global_fraction)
+
+        self._current_lch_l = self._start_lch_l + self._d_lch_l * global_fraction
+        self._current_lch_c = self._start_lch_c + self._d_lch_c * global_fraction
+        lch_h = self._start_lch_h + self._d_lch_h * global_fraction
+        if lch_h >= 360:
+            lch_h -= 360
+        elif lch_h < 0:
+            lch_h += 360
+        self._current_lch_h = lch_h
+        hue, saturation, value = _lch_to_hsv(
+            self._current_lch_l, self._current_lch_c, self._current_lch_h
         )
-        self._current_lch.lch_h = self._compute_hue_linear_update(
-            self._current_lch.lch_h, self._target_lch.lch_h, travel_fraction
-        )
-        current_hsv = colormath.color_conversions.convert_color(
-            self._current_lch, colormath.color_objects.HSVColor
-        )
-        self._current_state.hue = current_hsv.hsv_h
-        self._current_state.saturation = current_hsv.hsv_s * 100
-        self._current_state.brightness = current_hsv.hsv_v * 100
-
-    def _other_fade(self, travel_fraction, is_first_step, is_last_step):
-        self._linear_fade_brightness(travel_fraction)
-        self._linear_fade_color_temp(travel_fraction)
-        self._linear_fade_saturation(travel_fraction)
-
-        assert self._current_state.hue == self._target_state.hue
-
-    def _linear_fade_brightness(self, travel_fraction):
-        if self._current_state.brightness != self._target_state.brightness:
-            self._current_state.brightness = self._compute_linear_update(
-                self._current_state.brightness,
-                self._target_state.brightness,
-                travel_fraction,
+        self._current_state.hue = hue
+        self._current_state.saturation = saturation * 100
+        self._current_state.brightness = value * 100
+
+    def _other_fade(self, global_fraction, is_first_step, is_last_step):
+        # The hue can't change in an OTHER fade; checked once in __init__.
+        self._linear_fade_brightness(global_fraction)
+        self._linear_fade_color_temp(global_fraction)
+        self._linear_fade_saturation(global_fraction)
+
+    def _linear_fade_brightness(self, global_fraction):
+        if self._d_brightness != 0:
+            self._current_state.brightness = (
+                self._start_brightness + self._d_brightness * global_fraction
             )
 
-    def _linear_fade_color_temp(self, travel_fraction):
-        if (
-            self._current_state.color_temp_kelvin
-            != self._target_state.color_temp_kelvin
-        ):
-            self._current_state.color_temp_kelvin = self._compute_linear_update(
-                self._current_state.color_temp_kelvin,
-                self._target_state.color_temp_kelvin,
-                travel_fraction,
+    def _linear_fade_color_temp(self, global_fraction):
+        if self._d_color_temp != 0:
+            self._current_state.color_temp_kelvin = (
+                self._start_color_temp + self._d_color_temp * global_fraction
             )
 
-    def _linear_fade_saturation(self, travel_fraction):
-        if self._current_state.saturation != self._target_state.saturation:
-            self._current_state.saturation = self._compute_linear_update(
-                self._current_state.saturation,
-                self._target_state.saturation,
-                travel_fraction,
+    def _linear_fade_saturation(self, global_fraction):
+        if self._d_saturation != 0:
+            self._current_state.saturation = (
+                self._start_saturation + self._d_saturation * global_fraction
             )
 
-    def _compute_linear_update(self, current_value, target_value, travel_fraction):
-        return current_value + (target_value - current_value) * travel_fraction
-
-    def _compute_hue_linear_update(self, current_value, target_value, travel_fraction):
-        if target_value - current_value > 180:
-            current_value += 360
-        elif current_value - target_value > 180:
-            current_value -= 360
-
-        new_value = self._compute_linear_update(
-            current_value, target_value, travel_fraction
-        )
-
-        if new_value >= 360:
-            new_value -= 360
-        elif new_value < 0:
-            new_value += 360
-        return new_value
-
 
 class Fader(pyartnet.fades.FadeBase):
+    __slots__ = ("_channel_i", "_controller")
+
     def __init__(self, channel_i: int, controller: FadeController) -> None:
         super().__init__()
         self._channel_i = channel_i
@@ -315,6 +470,8 @@ class Fader(pyartnet.fades.FadeBase):
         pass
 
     def calc_next_value(self) -> float:
-        next_value, is_done = self._controller.calc_next_value(self._channel_i)
-        self.is_done = is_done
-        return next_value
+        controller = self._controller
+        if self._channel_i == 0:
+            controller.tick()
+        self.is_done = controller.is_done
+        return controller.current_values[self._channel_i]
@@ -2,13 +2,13 @@
 # python3 -m ct_hs_artnet_led.fade_tests
 
 import asyncio
-import copy
+from dataclasses import replace
 import logging
 import yaml
 
 import pyartnet
 
-from . import ChannelCoders, DmxLightState, FadeController, Fader
+from . import ChannelCoders, DmxLightState, FadeController
 
 CALC_FPS = 1000
 FADE_FPS = 50
@@ -131,9 +131,9 @@ async def main():
         hue=END_HUE,
         saturation=END_SATURATION,
     )
-    current_state = copy.deepcopy(start_state)
+    current_state = replace(start_state)
 
-    values = [0] * coders.num_channels()
+    values = bytearray(coders.num_channels())
     coders.encode(values, start_state)
     channel.set_fade(values, 0)
 
@@ -148,11 +148,7 @@ async def main():
             UPDATE_STATE_FREQUENCY_SECS,
             lambda: None,
         )
-        faders = []
-        for i in range(coders.num_channels()):
-            faders.append(Fader(i, controller))
-
-        channel.set_fade(faders, 1)
+        channel.set_fade(controller.make_faders(), 1)
 
         await channel
         if is_first:
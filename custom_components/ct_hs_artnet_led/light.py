@@ -1,6 +1,5 @@
 import asyncio
-import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import logging
 import math
 import time
@@ -28,7 +27,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 import homeassistant.util.color as color_util
 
-from . import ChannelCoders, DmxLightState, FadeController, Fader
+from . import ChannelCoders, DmxLightState, FadeController
 
 
 log = logging.getLogger(__name__)
@@ -107,6 +106,12 @@ class DmxLight(LightEntity, RestoreEntity):
         ]
         self._fade_fps = config["intended_fade_fps"]
 
+        # Home Assistant reads rgbww_color on every state write, including
+        # the periodic updates during a fade; cache the conversion keyed on
+        # the fields it depends on.
+        self._rgbww_cache_key = None
+        self._rgbww_cache_value = None
+
         self._previous_state = None
         self._state = DmxLightState(
             brightness=0,
@@ -116,6 +121,10 @@ class DmxLight(LightEntity, RestoreEntity):
         )
 
         self._coders = ChannelCoders(type_config)
+        # Reused for every zero-transition update; pyartnet's set_fade
+        # consumes the values synchronously, so the buffer can be mutated
+        # again on the next call.
+        self._values_buf = bytearray(self._coders.num_channels())
         self._channel = universe.add_channel(
             start=entity_config["channel"],
             width=self._coders.num_channels(),
@@ -141,6 +150,10 @@ class DmxLight(LightEntity, RestoreEntity):
 
     @property
     def rgbww_color(self) -> tuple[int, int, int, int, int] | None:
+        key = (self._state.hue, self._state.saturation, self._state.color_temp_kelvin)
+        if key == self._rgbww_cache_key:
+            return self._rgbww_cache_value
+
         r, g, b = color_util.color_hs_to_RGB(self._state.hue, self._state.saturation)
         _, _, _, c, w = color_util.color_temperature_to_rgbww(
             self._state.color_temp_kelvin,
@@ -148,12 +161,14 @@ class DmxLight(LightEntity, RestoreEntity):
             self.min_color_temp_kelvin,
             self.max_color_temp_kelvin,
         )
-        return (r, g, b, c, w)
+        self._rgbww_cache_key = key
+        self._rgbww_cache_value = (r, g, b, c, w)
+        return self._rgbww_cache_value
 
     async def async_added_to_hass(self) -> None:
         old_state = await self.async_get_last_state()
         if old_state is not None:
-            log.debug(f"DmxLight.async_added_to_hass({old_state})")
+            log.debug("DmxLight.async_added_to_hass(%s)", old_state)
 
             if old_state.state == STATE_ON:
                 await self.async_turn_on(
@@ -166,11 +181,11 @@ class DmxLight(LightEntity, RestoreEntity):
                 await self.async_turn_off()
 
     async def async_turn_on(self, **kwargs):
-        log.debug(f"DmxLight.async_turn_on({kwargs})")
+        log.debug("DmxLight.async_turn_on(%s)", kwargs)
 
         transition_secs = kwargs.get(ATTR_TRANSITION, self._default_transition_secs)
 
-        target_state = copy.deepcopy(self._state)
+        target_state = replace(self._state)
 
         if ATTR_BRIGHTNESS in kwargs:
             target_state.brightness = kwargs[ATTR_BRIGHTNESS] / 255 * 100
@@ -224,11 +239,11 @@ class DmxLight(LightEntity, RestoreEntity):
         await self._run_fade(target_state, transition_secs)
 
     async def async_turn_off(self, **kwargs):
-        log.debug(f"DmxLight.async_turn_off({kwargs})")
+        log.debug("DmxLight.async_turn_off(%s)", kwargs)
 
         transition_secs = kwargs.get(ATTR_TRANSITION, self._default_transition_secs)
 
-        self._previous_state = copy.deepcopy(self._state)
+        self._previous_state = replace(self._state)
         target_state = DmxLightState(
             brightness=0,
             color_temp_kelvin=self._attr_min_color_temp_kelvin,
@@ -243,16 +258,23 @@ class DmxLight(LightEntity, RestoreEntity):
         target_state: DmxLightState,
         transition_secs: float,
     ) -> None:
-        log.debug(f"DmxLight._run_fade(")
-        log.debug(f"    current_state={self._state},")
-        log.debug(f"    {target_state=},")
-        log.debug(f"    {transition_secs=})")
+        log.debug(
+            "DmxLight._run_fade(current_state=%s, target_state=%s,"
+            " transition_secs=%s)",
+            self._state,
+            target_state,
+            transition_secs,
+        )
+
+        # Automations and scene re-applies routinely repeat a turn_on with
+        # the state the light is already in; skip the DMX write entirely.
+        if target_state == self._state:
+            return
 
         if transition_secs == 0:
             self._state = target_state
-            values = [0] * self._coders.num_channels()
-            self._coders.encode(values, self._state)
-            self._channel.set_fade(values, 0)
+            self._coders.encode(self._values_buf, self._state)
+            self._channel.set_fade(self._values_buf, 0)
             self.async_schedule_update_ha_state()
         else:
             controller = FadeController(
@@ -264,8 +286,4 @@ class DmxLight(LightEntity, RestoreEntity):
                 self._ha_state_update_freq_secs,
                 self.async_schedule_update_ha_state,
             )
-            faders = []
-            for i in range(self._coders.num_channels()):
-                faders.append(Fader(i, controller))
-
-            self._channel.set_fade(faders, 1)
+            self._channel.set_fade(controller.make_faders(), 1)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DmxLightState:
     brightness: float  # Range: [0, 100]
     color_temp_kelvin: float